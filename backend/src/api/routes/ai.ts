@@ -9,6 +9,11 @@ interface ExtractDocumentBody {
   expectedBorrowerName?: string;
 }
 
+interface AnalyzeLeadsBody {
+  leads: Array<{ content: string; rawSource: string }>;
+  reasoningModel?: string;
+}
+
 interface ChatBody {
   history: Array<{ role: string; parts: Array<{ text: string }> }>;
   message: string;
@@ -484,6 +489,109 @@ Determine an urgency score (0-100) and provide a one-sentence summary of your an
     }
   );
 
+  /**
+   * POST /analyze-leads-urgency
+   * Analyze urgency for a batch of leads in a single AI call
+   */
+  fastify.post<{ Body: AnalyzeLeadsBody }>(
+    '/analyze-leads-urgency',
+    {
+      preHandler: createRateLimitMiddleware(RateLimitPresets.ai),
+      schema: {
+        description: 'Analyze urgency for multiple leads using one AI call',
+        tags: ['AI'],
+        body: {
+          type: 'object',
+          required: ['leads'],
+          properties: {
+            leads: {
+              type: 'array',
+              items: {
+                type: 'object',
+                required: ['content', 'rawSource'],
+                properties: {
+                  content: { type: 'string' },
+                  rawSource: { type: 'string' }
+                }
+              },
+              minItems: 1,
+              maxItems: 20 // Limit batch size
+            },
+            reasoningModel: { type: 'string' }
+          }
+        }
+      }
+    },
+    async (request, reply) => {
+      const { leads, reasoningModel } = request.body;
+
+      if (!ai) {
+        return reply.code(500).send({
+          error: 'AI service is not configured. Please check API key configuration.'
+        });
+      }
+
+      try {
+        const leadList = leads
+          .map((lead, index) => `${index + 1}. LEAD CONTENT: "${lead.content}"\n   SOURCE: "${lead.rawSource}"`)
+          .join('\n');
+
+        const prompt = `
+Act as a Senior Mortgage Underwriter. Analyze each of the following ${leads.length} leads and determine their urgency to purchase or refinance.
+
+${leadList}
+
+For every lead, determine an urgency score (0-100) and provide a one-sentence summary of your analysis.
+Return a JSON array of exactly ${leads.length} objects in the same order as the numbered leads.
+        `;
+
+        const model = ai.getGenerativeModel({
+          model: reasoningModel || 'gemini-2.0-flash-exp',
+          generationConfig: {
+            responseMimeType: 'application/json',
+            responseSchema: {
+              type: SchemaType.ARRAY,
+              items: {
+                type: SchemaType.OBJECT,
+                properties: {
+                  score: { type: SchemaType.NUMBER, description: 'Integer 0-100 based on intent to buy now' },
+                  analysis: { type: SchemaType.STRING, description: '1 sentence summary of why' }
+                },
+                required: ['score', 'analysis']
+              }
+            }
+          }
+        });
+
+        const result = await model.generateContent(prompt);
+        const parsed = JSON.parse(result.response.text() || '[]');
+
+        // Results are matched to leads by position, so a short or long array is unusable
+        if (!Array.isArray(parsed) || parsed.length !== leads.length) {
+          fastify.log.error(
+            `Batch lead analysis returned ${Array.isArray(parsed) ? parsed.length : 'non-array'} results for ${leads.length} leads`
+          );
+          return reply.code(502).send({
+            error: 'AI returned a mismatched number of lead analyses.'
+          });
+        }
+
+        return reply.send({
+          results: parsed.map((item: any) => ({
+            score: typeof item?.score === 'number' ? item.score : 0,
+            analysis: item?.analysis || 'Could not generate analysis summary.'
+          }))
+        });
+
+      } catch (error) {
+        fastify.log.error(`Batch lead analysis error: ${(error as Error).message}`);
+        return reply.code(500).send({
+          error: 'AI Analysis engine encountered an error.'
+        });
+      }
+    }
+  );
+
   /**
    * POST /generate-chaser-sms
    * Generate automated chaser SMS template
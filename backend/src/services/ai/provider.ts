@@ -1,5 +1,5 @@
-import { GoogleGenAI } from '@google/genai';
-import Anthropic from '@anthropic-ai/sdk';
+import type { GoogleGenAI } from '@google/genai';
+import type Anthropic from '@anthropic-ai/sdk';
 import { config } from '../../config/index.js';
 
 export type AIProvider = 'gemini' | 'claude';
@@ -20,17 +20,37 @@ export interface AIResponse {
  * Supports both Gemini and Claude for flexibility
  */
 export class AIService {
-  private gemini: GoogleGenAI | null = null;
-  private claude: Anthropic | null = null;
+  private geminiClient: GoogleGenAI | null = null;
+  private claudeClient: Anthropic | null = null;
 
-  constructor() {
-    if (config.ai.geminiApiKey) {
-      this.gemini = new GoogleGenAI({ apiKey: config.ai.geminiApiKey });
+  /**
+   * Gemini client (lazy initialization)
+   * The SDK is only loaded on the first Gemini call
+   */
+  private async getGemini(): Promise<GoogleGenAI> {
+    if (!this.geminiClient) {
+      if (!config.ai.geminiApiKey) {
+        throw new Error('Gemini API not configured');
+      }
+      const { GoogleGenAI } = await import('@google/genai');
+      this.geminiClient ??= new GoogleGenAI({ apiKey: config.ai.geminiApiKey });
     }
+    return this.geminiClient;
+  }
 
-    if (config.ai.anthropicApiKey) {
-      this.claude = new Anthropic({ apiKey: config.ai.anthropicApiKey });
+  /**
+   * Claude client (lazy initialization)
+   * The SDK is only loaded on the first Claude call
+   */
+  private async getClaude(): Promise<Anthropic> {
+    if (!this.claudeClient) {
+      if (!config.ai.anthropicApiKey) {
+        throw new Error('Claude API not configured');
+      }
+      const { default: Anthropic } = await import('@anthropic-ai/sdk');
+      this.claudeClient ??= new Anthropic({ apiKey: config.ai.anthropicApiKey });
     }
+    return this.claudeClient;
   }
 
   /**
@@ -55,9 +75,9 @@ Format the summary in 3-4 sentences maximum. Be professional and factual.`;
       ...messages,
     ];
 
-    if (provider === 'gemini' && this.gemini) {
+    if (provider === 'gemini' && config.ai.geminiApiKey) {
       return await this.callGemini(formattedMessages);
-    } else if (provider === 'claude' && this.claude) {
+    } else if (provider === 'claude' && config.ai.anthropicApiKey) {
       return await this.callClaude(formattedMessages);
     }
 
@@ -127,12 +147,9 @@ Respond with ONE word only: "ok", "warning", or "blocked"`;
   }
 
   private async callGemini(messages: AIMessage[]): Promise<AIResponse> {
-    if (!this.gemini) {
-      throw new Error('Gemini API not configured');
-    }
-
+    const gemini = await this.getGemini();
     const model = 'models/gemini-2.0-flash-exp';
-    const chat = this.gemini.chats.create({
+    const chat = gemini.chats.create({
       model,
       config: {
         temperature: 0.7,
@@ -154,14 +171,11 @@ Respond with ONE word only: "ok", "warning", or "blocked"`;
   }
 
   private async callClaude(messages: AIMessage[]): Promise<AIResponse> {
-    if (!this.claude) {
-      throw new Error('Claude API not configured');
-    }
-
+    const claude = await this.getClaude();
     const systemMessage = messages.find((m) => m.role === 'system');
     const conversationMessages = messages.filter((m) => m.role !== 'system');
 
-    const response = await this.claude.messages.create({
+    const response = await claude.messages.create({
       model: 'claude-3-5-sonnet-20241022',
       max_tokens: 1024,
       system: systemMessage?.content,
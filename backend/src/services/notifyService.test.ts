@@ -0,0 +1,49 @@
+import { describe, it, expect, vi } from 'vitest';
+import { NotifyService } from './notifyService.js';
+
+// Mock database and messaging providers
+vi.mock('../db/client');
+vi.mock('twilio', () => ({ default: vi.fn() }));
+vi.mock('@sendgrid/mail', () => ({
+  default: { setApiKey: vi.fn(), send: vi.fn() },
+}));
+
+describe('NotifyService', () => {
+  describe('substituteVariables', () => {
+    it('should replace every occurrence of a placeholder', () => {
+      const result = NotifyService.substituteVariables(
+        'Hi {{client_name}}, thanks {{client_name}}!',
+        { client_name: 'John Doe' }
+      );
+
+      expect(result).toBe('Hi John Doe, thanks John Doe!');
+    });
+
+    it('should leave unknown placeholders untouched', () => {
+      const result = NotifyService.substituteVariables(
+        'Hi {{client_name}}, your broker is {{broker_name}}',
+        { client_name: 'John Doe' }
+      );
+
+      expect(result).toBe('Hi John Doe, your broker is {{broker_name}}');
+    });
+
+    it('should insert replacement tokens in values literally', () => {
+      const result = NotifyService.substituteVariables(
+        'Balance: {{amount}} ({{note}})',
+        { amount: '$&100', note: '$1 due' }
+      );
+
+      expect(result).toBe('Balance: $&100 ($1 due)');
+    });
+
+    it('should not expand placeholders contained in values', () => {
+      const result = NotifyService.substituteVariables('{{a}}{{b}}', {
+        a: '{{b}}',
+        b: 'B',
+      });
+
+      expect(result).toBe('{{b}}B');
+    });
+  });
+});
@@ -33,6 +33,9 @@ interface ChaserOptions {
   createdByUserId?: string;
 }
 
+// Matches "{{variable_name}}" placeholders in message templates
+const TEMPLATE_VARIABLE_PATTERN = /\{\{([^{}]+)\}\}/g;
+
 export class NotifyService {
   private static twilioClient: twilio.Twilio | null = null;
   private static sendGridInitialized = false;
@@ -246,11 +249,9 @@ export class NotifyService {
    * Example: "Hi {{client_name}}" -> "Hi John Doe"
    */
   static substituteVariables(template: string, variables: Record<string, string>): string {
-    let result = template;
-    for (const [key, value] of Object.entries(variables)) {
-      result = result.replace(new RegExp(`{{${key}}}`, 'g'), value);
-    }
-    return result;
+    return template.replace(TEMPLATE_VARIABLE_PATTERN, (match, key: string) =>
+      Object.prototype.hasOwnProperty.call(variables, key) ? variables[key] : match
+    );
   }
 
   /**
@@ -16,11 +16,14 @@ interface SystemHealthData {
 
 const getSystemHealthData = async (): Promise<SystemHealthData> => {
   // Mock data for now - replace with actual queries
-  const totalLeads = await db.query('SELECT COUNT(*) as count FROM leads').then(r => parseInt(r.rows[0].count));
-  const activeLeads = await db.query("SELECT COUNT(*) as count FROM leads WHERE status IN ('active', 'processing')").then(r => parseInt(r.rows[0].count));
-  const convertedLeads = await db.query("SELECT COUNT(*) as count FROM leads WHERE status = 'converted'").then(r => parseInt(r.rows[0].count));
-  const reassignments = await db.query('SELECT COUNT(*) as count FROM lead_activity_log WHERE action = $1', ['reassigned']).then(r => parseInt(r.rows[0].count));
-  const aiTasksCompleted = await db.query('SELECT COUNT(*) as count FROM document_extractions').then(r => parseInt(r.rows[0].count));
+  // Counts are independent, so run them concurrently on the pool
+  const [totalLeads, activeLeads, convertedLeads, reassignments, aiTasksCompleted] = await Promise.all([
+    db.query('SELECT COUNT(*) as count FROM leads').then(r => parseInt(r.rows[0].count)),
+    db.query("SELECT COUNT(*) as count FROM leads WHERE status IN ('active', 'processing')").then(r => parseInt(r.rows[0].count)),
+    db.query("SELECT COUNT(*) as count FROM leads WHERE status = 'converted'").then(r => parseInt(r.rows[0].count)),
+    db.query('SELECT COUNT(*) as count FROM lead_activity_log WHERE action = $1', ['reassigned']).then(r => parseInt(r.rows[0].count)),
+    db.query('SELECT COUNT(*) as count FROM document_extractions').then(r => parseInt(r.rows[0].count)),
+  ]);
 
   // Mock other data
   const avgResponseTime = 12; // minutes
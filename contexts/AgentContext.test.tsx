@@ -27,7 +27,9 @@ vi.mock('../services/geminiService', () => ({
 vi.mock('../services/apiService', () => ({
   APIService: {
     extractDocument: vi.fn(),
-    generateChaserSMS: vi.fn()
+    generateChaserSMS: vi.fn(),
+    analyzeLeadUrgency: vi.fn(),
+    analyzeLeadsUrgency: vi.fn()
   }
 }));
 
@@ -177,4 +179,58 @@ describe('MortgageExtractionResult and extractMortgageDocument', () => {
 
     expect(result.current.isProcessing).toBe(false);
   });
-});
\ No newline at end of file
+});
+
+describe('processLeadBatch', () => {
+  const rawLeads = [
+    { id: 'lead-1', rawSource: 'Zillow', content: 'Pre-approved, closing next month', status: 'new' as const, timestamp: '2024-01-01' },
+    { id: 'lead-2', rawSource: 'Referral', content: 'Just browsing rates', status: 'new' as const, timestamp: '2024-01-01' }
+  ];
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    localStorageMock.getItem.mockReturnValue(null);
+    localStorageMock.setItem.mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    cleanup();
+  });
+
+  it('should analyze a batch of leads with a single API call', async () => {
+    vi.mocked(APIService.analyzeLeadsUrgency).mockResolvedValue([
+      { score: 90, analysis: 'Ready to buy' },
+      { score: 20, analysis: 'Early research' }
+    ]);
+
+    const { result } = renderHook(() => useAgent(), { wrapper: AgentProvider });
+
+    await act(async () => {
+      await result.current.processLeadBatch(rawLeads);
+    });
+
+    expect(APIService.analyzeLeadsUrgency).toHaveBeenCalledTimes(1);
+    expect(APIService.analyzeLeadUrgency).not.toHaveBeenCalled();
+    expect(result.current.leads).toEqual(expect.arrayContaining([
+      expect.objectContaining({ id: 'lead-1', urgencyScore: 90, status: 'processed' }),
+      expect.objectContaining({ id: 'lead-2', urgencyScore: 20, status: 'processed' })
+    ]));
+  });
+
+  it('should fall back to per-lead analysis when the batch call fails', async () => {
+    vi.mocked(APIService.analyzeLeadsUrgency).mockRejectedValue(new Error('Batch failed'));
+    vi.mocked(APIService.analyzeLeadUrgency).mockResolvedValue({ score: 50, analysis: 'Moderate intent' });
+
+    const { result } = renderHook(() => useAgent(), { wrapper: AgentProvider });
+
+    await act(async () => {
+      await result.current.processLeadBatch(rawLeads);
+    });
+
+    expect(APIService.analyzeLeadUrgency).toHaveBeenCalledTimes(2);
+    expect(result.current.leads).toEqual(expect.arrayContaining([
+      expect.objectContaining({ id: 'lead-1', urgencyScore: 50, status: 'processed' }),
+      expect.objectContaining({ id: 'lead-2', urgencyScore: 50, status: 'processed' })
+    ]));
+  });
+});
@@ -382,38 +382,64 @@ export const AgentProvider: React.FC<{ children: React.ReactNode }> = ({ childre
     for (let i = 0; i < initializedLeads.length; i += BATCH_SIZE) {
       const batch = initializedLeads.slice(i, i + BATCH_SIZE);
 
-      // Process batch in parallel
-      const batchPromises = batch.map(async (lead) => {
-        try {
-          // Use secure backend API instead of direct Gemini calls
-          const analysis = await APIService.analyzeLeadUrgency(
-            lead.content,
-            lead.rawSource,
-            config.brain.reasoningModel
-          );
-          incrementUsage(2);
-
-          return {
-            leadId: lead.id,
-            urgencyScore: analysis.score,
-            analysis: analysis.analysis,
-            status: 'processed' as const,
-            error: null
-          };
-        } catch (e) {
-          console.error("Analysis for lead failed:", lead.id, e);
-          return {
-            leadId: lead.id,
-            urgencyScore: undefined,
-            analysis: undefined,
-            status: 'new' as const,
-            error: e
-          };
-        }
-      });
+      let results: Array<{
+        leadId: string;
+        urgencyScore?: number;
+        analysis?: string;
+        status: Lead['status'];
+        error: unknown;
+      }>;
+      try {
+        // Analyze the whole batch in a single backend AI call
+        const analyses = await APIService.analyzeLeadsUrgency(
+          batch.map(lead => ({ content: lead.content, rawSource: lead.rawSource })),
+          config.brain.reasoningModel
+        );
+        incrementUsage(2 * batch.length);
+
+        results = batch.map((lead, index) => ({
+          leadId: lead.id,
+          urgencyScore: analyses[index].score,
+          analysis: analyses[index].analysis,
+          status: 'processed' as const,
+          error: null
+        }));
+      } catch (batchError) {
+        console.error("Batch analysis failed, falling back to per-lead analysis:", batchError);
+
+        // Fall back to one request per lead, in parallel
+        const batchPromises = batch.map(async (lead) => {
+          try {
+            // Use secure backend API instead of direct Gemini calls
+            const analysis = await APIService.analyzeLeadUrgency(
+              lead.content,
+              lead.rawSource,
+              config.brain.reasoningModel
+            );
+            incrementUsage(2);
+
+            return {
+              leadId: lead.id,
+              urgencyScore: analysis.score,
+              analysis: analysis.analysis,
+              status: 'processed' as const,
+              error: null
+            };
+          } catch (e) {
+            console.error("Analysis for lead failed:", lead.id, e);
+            return {
+              leadId: lead.id,
+              urgencyScore: undefined,
+              analysis: undefined,
+              status: 'new' as const,
+              error: e
+            };
+          }
+        });
 
-      // Wait for entire batch to complete
-      const results = await Promise.all(batchPromises);
+        // Wait for entire batch to complete
+        results = await Promise.all(batchPromises);
+      }
 
       // Update all leads in batch at once
       setLeads(prev => prev.map(l => {
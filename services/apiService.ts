@@ -257,6 +257,37 @@ export class APIService {
     return await response.json();
   }
 
+  /**
+   * Analyze urgency for a batch of leads via backend API (one AI call)
+   */
+  static async analyzeLeadsUrgency(
+    leads: Array<{ content: string; rawSource: string }>,
+    reasoningModel?: string
+  ): Promise<LeadAnalysisResponse[]> {
+    const response = await fetch(`${API_BASE_URL}/api/ai/analyze-leads-urgency`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        ...(getAuthToken() ? { 'Authorization': `Bearer ${getAuthToken()}` } : {})
+      },
+      body: JSON.stringify({
+        leads,
+        reasoningModel
+      })
+    });
+
+    if (!response.ok) {
+      throw new Error(`API request failed: ${response.statusText}`);
+    }
+
+    const { results } = await response.json();
+    if (!Array.isArray(results) || results.length !== leads.length) {
+      throw new Error('Batch lead analysis returned a mismatched number of results');
+    }
+
+    return results;
+  }
+
   /**
    * Generate automated chaser SMS via backend API
    */